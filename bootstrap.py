@@ -0,0 +1,129 @@
+"""Sample library bootstrap.
+
+The sample documents in data/ are chunked and embedded once and saved as a bundle of chunk
+texts and float32 vectors, so startup only loads them into the DB and the index. Each
+embedder has its own bundle file, so backends never overwrite each other's vectors. The bundle
+records the embedder, chunker and source texts it was built from and is rebuilt when any of
+them change. Run `python bootstrap.py` to prebuild it for the configured embedder.
+"""
+import hashlib
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID, uuid4
+import numpy as np
+from models import Chunk, Document, Library
+from db import DB, indexer, chunker
+from embedding.embedder import get_default_embedder, batch_embedder
+
+SAMPLE_LIBRARY_ID = UUID("838da7d4-73aa-4463-998d-b62e6b27afcd")
+SAMPLE_DOCUMENT_PATHS = ['data/cristiano_ronaldo.txt', 'data/leo_messi.txt', 'data/rafa_nadal.txt']
+BUNDLE_DIR = os.getenv("SAMPLE_BUNDLE_DIR", "data")
+# when set (e.g. in the Docker image, where the bundle is built at build time) a missing or
+# stale bundle fails readiness instead of being rebuilt through the embedding API at boot
+BUNDLE_REQUIRED = os.getenv("SAMPLE_BUNDLE_REQUIRED", "") not in ("", "0", "false")
+# maximum number of texts per embedding call (Cohere limit)
+EMBED_BATCH_SIZE = 96
+
+def bundle_signature(contents: List[str]) -> str:
+	digest = hashlib.sha256()
+	digest.update(get_default_embedder().name.encode())
+	digest.update(repr((type(chunker).__name__, sorted(vars(chunker).items()))).encode())
+	for content in contents:
+		digest.update(hashlib.sha256(content.encode()).digest())
+	return digest.hexdigest()
+
+def default_bundle_path() -> str:
+	return os.path.join(BUNDLE_DIR, f"sample_library.{get_default_embedder().name}.npz")
+
+def build_bundle(paths: List[str] = SAMPLE_DOCUMENT_PATHS, bundle_path: Optional[str] = None) -> Dict[str, np.ndarray]:
+	bundle_path = bundle_path or default_bundle_path()
+	contents = []
+	for path in paths:
+		with open(path, 'r') as f:
+			contents.append(f.read())
+
+	chunk_texts, chunk_docs = [], []
+	for doc_index, content in enumerate(contents):
+		for offset, length in chunker.iter_chunks(content):
+			chunk_texts.append(content[offset:offset + length])
+			chunk_docs.append(doc_index)
+
+	vectors = [np.asarray(batch_embedder(chunk_texts[i:i + EMBED_BATCH_SIZE], input_type='search_document'), dtype=np.float32)
+		for i in range(0, len(chunk_texts), EMBED_BATCH_SIZE)]
+
+	bundle = {
+		"signature": np.array(bundle_signature(contents)),
+		"titles": np.array([f'Sample Document {index}' for index in range(len(contents))]),
+		"contents": np.array(contents),
+		"chunk_texts": np.array(chunk_texts),
+		"chunk_docs": np.array(chunk_docs, dtype=np.int32),
+		"vectors": np.concatenate(vectors).astype(np.float32),
+	}
+
+	# write to a temporary file first so a crash never leaves a truncated bundle behind
+	tmp_path = bundle_path + ".tmp"
+	try:
+		with open(tmp_path, 'wb') as f:
+			np.savez(f, **bundle)
+		os.replace(tmp_path, bundle_path)
+	except OSError as e:
+		print(f"Could not save sample bundle to {bundle_path}: {e}")
+	return bundle
+
+def load_bundle(paths: List[str] = SAMPLE_DOCUMENT_PATHS, bundle_path: Optional[str] = None) -> Optional[Dict[str, np.ndarray]]:
+	bundle_path = bundle_path or default_bundle_path()
+	if not os.path.exists(bundle_path):
+		return None
+	with np.load(bundle_path, allow_pickle=False) as data:
+		bundle = {key: data[key] for key in data.files}
+	if str(bundle["signature"]) != bundle_signature([str(content) for content in bundle["contents"]]):
+		return None
+	# the bundle is stale if the source texts changed on disk
+	for path, content in zip(paths, bundle["contents"]):
+		with open(path, 'r') as f:
+			if f.read() != str(content):
+				return None
+	return bundle
+
+def load_sample_library(db: DB, started_at: float) -> None:
+	try:
+		bundle = load_bundle()
+		if bundle is None:
+			if BUNDLE_REQUIRED:
+				raise RuntimeError(f"Sample bundle {default_bundle_path()} is missing or stale and SAMPLE_BUNDLE_REQUIRED is set")
+			print("Sample bundle missing or stale, embedding the sample documents")
+			bundle = build_bundle()
+
+		def f():
+			timestamp = datetime.now()
+			library = Library(id=SAMPLE_LIBRARY_ID, name="Example Library", description="A library for testing")
+			documents = [Document(id=uuid4(), library_id=SAMPLE_LIBRARY_ID, title=str(title), content=str(content), timestamp=timestamp)
+				for title, content in zip(bundle["titles"], bundle["contents"])]
+
+			for text, doc_index, vector in zip(bundle["chunk_texts"], bundle["chunk_docs"], bundle["vectors"]):
+				document = documents[doc_index]
+				chunk = Chunk(id=uuid4(), document_id=document.id, content=str(text), timestamp=timestamp)
+				db.chunks[chunk.id] = chunk
+				document.chunks.append(chunk.id)
+				indexer.add(chunk.id, vector)
+
+			for document in documents:
+				db.documents[document.id] = document
+				library.document_ids.append(document.id)
+			db.libraries[library.id] = library
+
+		db.lock_write(f)
+		db.startup_seconds = time.perf_counter() - started_at
+		db.ready.set()
+		print(f"Library created with ID: {SAMPLE_LIBRARY_ID} ({len(bundle['chunk_texts'])} chunks, ready in {db.startup_seconds:.3f}s)")
+	except Exception as e:
+		db.startup_error = repr(e)
+		print(f"Sample library bootstrap failed: {db.startup_error}")
+		raise
+
+if __name__ == "__main__":
+	start = time.perf_counter()
+	bundle = build_bundle()
+	print(f"Bundle with {len(bundle['chunk_texts'])} chunks written to {default_bundle_path()} in {time.perf_counter() - start:.2f}s")
@@ -1,12 +1,66 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List, Pattern, TextIO, Tuple, Union
+
+# (offset, length) of a chunk, in characters, relative to the start of the source
+Span = Tuple[int, int]
+TextSource = Union[str, TextIO]
+
+# size of the blocks read from file-like sources
+BLOCK_SIZE = 64 * 1024
+# longest unit (word, token, sentence) kept in memory while waiting for its end
+MAX_MATCH_SIZE = 64 * 1024
 
 class BaseChunker(ABC):
 	@abstractmethod
-	def chunk(self, text: str) -> List[str]:
+	def iter_chunks(self, source: TextSource) -> Iterator[Span]:
+		"""Lazily yield (offset, length) spans of the chunks of a text or text stream."""
 		pass
 
+	def chunk(self, text: str) -> List[str]:
+		return [text[offset:offset + length] for offset, length in self.iter_chunks(text)]
+
 class ChunkerCreator(ABC):
 	@abstractmethod
 	def create_chunker(self) -> BaseChunker:
 		pass
+
+# yield the source in blocks so file-like sources are never read whole into memory
+def iter_blocks(source: TextSource, block_size: int = BLOCK_SIZE) -> Iterator[str]:
+	if isinstance(source, str):
+		yield source
+		return
+	while True:
+		block = source.read(block_size)
+		if not block:
+			return
+		yield block
+
+# yield (offset, text) for every match of pattern in source. A match touching the end of
+# the buffered text is held back until the next block arrives, since it may continue there,
+# and the next scan restarts from its start. A held back match that reaches max_match_size
+# is cut at that size so a unit that never ends cannot grow the buffer without limit.
+def iter_matches(source: TextSource, pattern: Pattern, max_match_size: int = MAX_MATCH_SIZE) -> Iterator[Tuple[int, str]]:
+	buffer, base, pos = '', 0, 0
+	for block in iter_blocks(source):
+		buffer += block
+		while True:
+			match = pattern.search(buffer, pos)
+			if match is None:
+				pos = len(buffer)
+				break
+			if match.end() == len(buffer):
+				if match.end() - match.start() < max_match_size:
+					pos = match.start()
+					break
+				pos = match.start() + max_match_size
+				yield base + match.start(), buffer[match.start():pos]
+				continue
+			yield base + match.start(), match.group()
+			pos = match.end()
+		# drop the text already consumed
+		buffer = buffer[pos:]
+		base += pos
+		pos = 0
+
+	for match in pattern.finditer(buffer):
+		yield base + match.start(), match.group()
@@ -1,19 +1,60 @@
-from typing import List
-from chunking.base import BaseChunker, ChunkerCreator
+from typing import Iterator
+from collections import deque
+from chunking.base import BaseChunker, ChunkerCreator, Span, TextSource, iter_matches
+import re
+
+# words are whitespace separated runs; tokens are whole words and single punctuation marks.
+# These are not the model's subword tokens, which are usually more numerous, so leave headroom
+# when sizing chunks against an embedding model's token limit.
+WORD_PATTERN = re.compile(r'\S+')
+TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]')
 
 class FixedSizeChunker(BaseChunker):
-	def __init__(self, chunk_size: int = 200):
+	# unit "char": chunk_size and overlap are measured in characters and chunks are cut at word boundaries
+	# unit "token": chunk_size and overlap are measured in word/punctuation tokens
+	def __init__(self, chunk_size: int = 200, overlap: int = 0, unit: str = "char"):
+		if unit not in ("char", "token"):
+			raise ValueError(f"Unknown chunk size unit: {unit}")
+		if not 0 <= overlap < chunk_size:
+			raise ValueError("Overlap must be non-negative and smaller than the chunk size")
 		self.chunk_size = chunk_size
+		self.overlap = overlap
+		self.unit = unit
+		self.pattern = TOKEN_PATTERN if unit == "token" else WORD_PATTERN
+
+	# size of a window of units going from start to end
+	def _size(self, start: int, end: int, n_units: int) -> int:
+		return n_units if self.unit == "token" else end - start
+
+	def iter_chunks(self, source: TextSource) -> Iterator[Span]:
+		# window holds the (start, end) spans of the units of the chunk being built,
+		# fresh counts the units not yet emitted as part of a chunk
+		window = deque()
+		fresh = 0
+		for start, text in iter_matches(source, self.pattern):
+			end = start + len(text)
+			while window and self._size(window[0][0], end, len(window) + 1) > self.chunk_size:
+				if fresh:
+					chunk_end = window[-1][1]
+					yield window[0][0], chunk_end - window[0][0]
+					fresh = 0
+					# keep the trailing units that fit in the overlap for the next chunk
+					while window and self._size(window[0][0], chunk_end, len(window)) > self.overlap:
+						window.popleft()
+				else:
+					window.popleft()
+			# a single word longer than chunk_size becomes a chunk on its own
+			window.append((start, end))
+			fresh += 1
 
-	def chunk(self, text: str) -> List[str]:
-		chunks = []
-		for i in range(0, len(text), self.chunk_size):
-			chunks.append(text[i:i+self.chunk_size])
-		return chunks
+		if fresh:
+			yield window[0][0], window[-1][1] - window[0][0]
 
 class FixedSizeChunkerCreator(ChunkerCreator):
-	def __init__(self, chunk_size: int = 200):
+	def __init__(self, chunk_size: int = 200, overlap: int = 0, unit: str = "char"):
 		self.chunk_size = chunk_size
+		self.overlap = overlap
+		self.unit = unit
 
 	def create_chunker(self) -> BaseChunker:
-		return FixedSizeChunker(self.chunk_size)
+		return FixedSizeChunker(self.chunk_size, self.overlap, self.unit)
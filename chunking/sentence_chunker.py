@@ -1,14 +1,17 @@
-from typing import List
-from chunking.base import BaseChunker, ChunkerCreator
+from typing import Iterator
+from chunking.base import BaseChunker, ChunkerCreator, Span, TextSource, iter_matches
 import re
 
+# a sentence runs up to a [.!?] followed by whitespace, or up to the end of the text
+SENTENCE_PATTERN = re.compile(r'\S.*?(?:[.!?](?=\s)|\Z)', re.DOTALL)
+
 class SentenceChunker(BaseChunker):
 	def __init__(self):
 		pass
 
-	def chunk(self, text: str) -> List[str]:
-		chunks = re.split(r'(?<=[.!?])\s+', text.strip())
-		return chunks
+	def iter_chunks(self, source: TextSource) -> Iterator[Span]:
+		for offset, sentence in iter_matches(source, SENTENCE_PATTERN):
+			yield offset, len(sentence.rstrip())
 
 class SentenceChunkerCreator(ChunkerCreator):
 	def create_chunker(self) -> BaseChunker:
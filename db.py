@@ -1,7 +1,7 @@
 from models import Chunk, Document, Library
-from typing import Dict
+from typing import Dict, Optional
 from uuid import UUID
-from threading import Lock
+from threading import Event, Lock
 from indexing.factory import get_indexer
 from chunking.factory import get_chunker
 
@@ -11,6 +11,10 @@ class DB:
         self.documents: Dict[UUID, Document] = {}
         self.chunks: Dict[UUID, Chunk] = {}
         self.lock = Lock()
+        # set once the sample library is loaded and the index is warm
+        self.ready = Event()
+        self.startup_seconds: Optional[float] = None
+        self.startup_error: Optional[str] = None
 
     # Wrapper to avoid data races in write operations.
     def lock_write(self, func):
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import List
+import numpy as np
+
+class BaseEmbedder(ABC):
+    # identifies the backend and its settings, vectors from different names are not comparable
+    name: str
+
+    @abstractmethod
+    def embed(self, texts: List[str], input_type: str = 'search_document') -> np.ndarray:
+        """Embed a batch of texts. Returns a float32 array of shape (len(texts), dim).
+        input_type should be search_document or search_query."""
+        pass
+
+class EmbedderCreator(ABC):
+    @abstractmethod
+    def create_embedder(self) -> BaseEmbedder:
+        pass
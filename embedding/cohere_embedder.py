@@ -0,0 +1,30 @@
+from embedding.base import BaseEmbedder, EmbedderCreator
+from typing import List, Optional
+import numpy as np
+
+class CohereEmbedder(BaseEmbedder):
+    def __init__(self, api_key: Optional[str] = None, model: str = "embed-english-v3.0"):
+        self.api_key = api_key
+        self.model = model
+        self.name = f"cohere-{model}"
+        self._client = None
+
+    # the SDK is slow to import, so it is imported and the client built on the first call
+    @property
+    def client(self):
+        if self._client is None:
+            import cohere
+            self._client = cohere.Client(api_key=self.api_key)
+        return self._client
+
+    def embed(self, texts: List[str], input_type: str = 'search_document') -> np.ndarray:
+        response = self.client.embed(texts=texts, model=self.model, input_type=input_type)
+        return np.asarray(response.embeddings, dtype=np.float32)
+
+class CohereEmbedderCreator(EmbedderCreator):
+    def __init__(self, api_key: Optional[str] = None, model: str = "embed-english-v3.0"):
+        self.api_key = api_key
+        self.model = model
+
+    def create_embedder(self) -> BaseEmbedder:
+        return CohereEmbedder(self.api_key, self.model)
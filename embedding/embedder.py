@@ -1,16 +1,40 @@
-import cohere
 import os
+from threading import Lock
+from typing import List, Optional
 from dotenv import load_dotenv
+from embedding.base import BaseEmbedder
+from embedding.factory import get_embedder
 
 # Load environment variables (.env file)
 load_dotenv()
 
-# Get the API key 
-cohere_api_key = os.getenv("COHERE_API_KEY")
-client = cohere.Client(api_key=cohere_api_key)
+_embedder: Optional[BaseEmbedder] = None
+_embedder_lock = Lock()
+
+# Select the embedding backend: EMBEDDER=cohere (default) or local (offline, deterministic).
+# EMBEDDER_LATENCY_MS / EMBEDDER_JITTER_MS add a simulated API round trip to any backend,
+# EMBEDDER_PER_TEXT_MS adds a simulated cost per text so larger batches take longer.
+# The backend is built on first use so importing the app stays cheap.
+def get_default_embedder() -> BaseEmbedder:
+    global _embedder
+    if _embedder is None:
+        with _embedder_lock:
+            if _embedder is None:
+                _embedder = get_embedder(
+                    os.getenv("EMBEDDER", "cohere"),
+                    dim=int(os.getenv("EMBEDDING_DIM", "1024")),
+                    latency_ms=float(os.getenv("EMBEDDER_LATENCY_MS", "0")),
+                    jitter_ms=float(os.getenv("EMBEDDER_JITTER_MS", "0")),
+                    per_text_ms=float(os.getenv("EMBEDDER_PER_TEXT_MS", "0")),
+                    api_key=os.getenv("COHERE_API_KEY"),
+                )
+    return _embedder
 
 # function to generate vector embeddings of a chunk
 # note input type should be search_document or search_query
 def vector_embedder(text:str, input_type: str = 'search_document') -> list[float]:
-    response = client.embed(texts=[text], model="embed-english-v3.0", input_type=input_type)
-    return response.embeddings[0]
+    return get_default_embedder().embed([text], input_type=input_type)[0].tolist()
+
+# batched version, one backend call for all the texts
+def batch_embedder(texts: List[str], input_type: str = 'search_document') -> list[list[float]]:
+    return get_default_embedder().embed(texts, input_type=input_type).tolist()
@@ -0,0 +1,17 @@
+from typing import Optional
+from embedding.base import BaseEmbedder
+from embedding.local_embedder import HashingEmbedder, SimulatedLatencyEmbedder
+
+def get_embedder(embedder_type: str, dim: int = 1024, latency_ms: float = 0.0, jitter_ms: float = 0.0, per_text_ms: float = 0.0, api_key: Optional[str] = None) -> BaseEmbedder:
+    if embedder_type == "cohere":
+        # imported here so the local backends work without the cohere SDK installed
+        from embedding.cohere_embedder import CohereEmbedder
+        embedder = CohereEmbedder(api_key=api_key)
+    elif embedder_type == "local":
+        embedder = HashingEmbedder(dim=dim)
+    else:
+        raise ValueError(f"Unknown embedder type: {embedder_type}")
+
+    if latency_ms or jitter_ms or per_text_ms:
+        embedder = SimulatedLatencyEmbedder(embedder, latency_ms=latency_ms, jitter_ms=jitter_ms, per_text_ms=per_text_ms)
+    return embedder
@@ -0,0 +1,73 @@
+from embedding.base import BaseEmbedder, EmbedderCreator
+from typing import List
+import numpy as np
+import random
+import time
+
+class HashingEmbedder(BaseEmbedder):
+    """Offline embedder based on hashed character n-grams.
+
+    Every n-gram of the lowercased text is hashed into one of `dim` buckets with a +/-1 sign
+    and the counts are L2 normalised, so the vector of a text is deterministic and texts that
+    share words end up close to each other. A whole batch is hashed in a single NumPy pass.
+    """
+    def __init__(self, dim: int = 1024, ngram: int = 3):
+        self.dim = dim
+        self.ngram = ngram
+        self.name = f"hashing-{ngram}gram-{dim}"
+        # polynomial rolling hash coefficients (uint64 arithmetic wraps around)
+        self.powers = np.array([pow(1099511628211, j, 2**64) for j in range(ngram)], dtype=np.uint64)
+
+    def embed(self, texts: List[str], input_type: str = 'search_document') -> np.ndarray:
+        n = self.ngram
+        # pad with spaces so word boundaries give n-grams, and to at least n bytes so every
+        # text (even an empty one) has an n-gram and a non-zero vector
+        encoded = [(' ' + text.lower() + ' ').encode('utf-8').ljust(n) for text in texts]
+        lengths = np.array([len(e) for e in encoded], dtype=np.int64)
+
+        # all texts in one buffer, each followed by a separator byte owned by no text (-1),
+        # plus n trailing separators so the buffer always holds at least one window
+        data = np.frombuffer(b''.join(e + b'\x00' for e in encoded) + b'\x00' * n, dtype=np.uint8).astype(np.uint64)
+        owner = np.full(len(data), -1, dtype=np.int64)
+        owner[:len(data) - n] = np.repeat(np.arange(len(texts), dtype=np.int64), lengths + 1)
+        owner[np.cumsum(lengths + 1) - 1] = -1
+
+        # an n-gram is kept only if its first and last byte belong to the same text
+        windows = np.lib.stride_tricks.sliding_window_view(data, n)
+        first, last = owner[:len(windows)], owner[n - 1:]
+        valid = (first == last) & (first >= 0)
+        hashes = (windows[valid] * self.powers).sum(axis=1, dtype=np.uint64)
+
+        # mix the bits (murmur3 finaliser) before picking bucket and sign
+        hashes ^= hashes >> np.uint64(33)
+        hashes *= np.uint64(0xff51afd7ed558ccd)
+        hashes ^= hashes >> np.uint64(33)
+        buckets = (hashes % np.uint64(self.dim)).astype(np.int64)
+        signs = np.where(hashes >> np.uint64(63), -1.0, 1.0)
+
+        counts = np.bincount(first[valid] * self.dim + buckets, weights=signs, minlength=len(texts) * self.dim)
+        vectors = counts.reshape(len(texts), self.dim).astype(np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+class SimulatedLatencyEmbedder(BaseEmbedder):
+    """Wraps an embedder and sleeps on every call to mimic the round trip of a remote API."""
+    def __init__(self, embedder: BaseEmbedder, latency_ms: float = 100.0, jitter_ms: float = 0.0, per_text_ms: float = 0.0):
+        self.embedder = embedder
+        self.name = embedder.name
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.per_text_ms = per_text_ms
+
+    def embed(self, texts: List[str], input_type: str = 'search_document') -> np.ndarray:
+        delay_ms = self.latency_ms + self.per_text_ms * len(texts) + random.uniform(0, self.jitter_ms)
+        time.sleep(delay_ms / 1000)
+        return self.embedder.embed(texts, input_type)
+
+class HashingEmbedderCreator(EmbedderCreator):
+    def __init__(self, dim: int = 1024, ngram: int = 3):
+        self.dim = dim
+        self.ngram = ngram
+
+    def create_embedder(self) -> BaseEmbedder:
+        return HashingEmbedder(self.dim, self.ngram)
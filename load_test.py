@@ -0,0 +1,429 @@
+"""HTTP load generator for the RAG backend.
+
+Drives the FastAPI app either in-process (default) or through a running server (--url)
+with a weighted mix of library creation, document creation, search and deletes, and
+reports throughput, p50/p95/p99 latency and 4xx/5xx error rates per endpoint.
+
+In-process runs use the local embedding backend (EMBEDDER=local) so no network or API key
+is needed. Start a standalone server the same way to measure it through uvicorn:
+
+	EMBEDDER=local uvicorn main:app
+	python load_test.py --url http://localhost:8000 --concurrency 16 --duration 30
+
+--measure-startup starts uvicorn in a subprocess and reports the time until the liveness
+and readiness probes first succeed.
+
+A recorded traffic file can be replayed instead of the synthetic mix with --replay. It is a
+JSON lines file with one request per line: {"method": "POST", "path": "/documents/search",
+"json": {...}}. The placeholders {library_id} and {document_id} in the path or in string
+values of the body are replaced with ids of the sample library or created during the run.
+The id in the path of a DELETE is claimed, so each object is deleted at most once, and a
+recorded delete with nothing left to delete is skipped.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+import numpy as np
+
+SAMPLE_LIBRARY_ID = "838da7d4-73aa-4463-998d-b62e6b27afcd"
+DEFAULT_MIX = "create_library=1,create_document=4,search=12,delete_document=2,delete_library=1"
+SEARCH_QUERIES = ["Who won the Ballon d'Or?", "Grand Slam titles on clay", "Which clubs did he play for?",
+	"World Cup final", "Champions League records", "Injuries and comebacks", "Olympic gold medal"]
+
+# open loop requests sent this long after their scheduled time are reported as late
+LATE_THRESHOLD = 0.01
+
+# (endpoint label, method, path, json body)
+Request = Tuple[str, str, str, Optional[Dict[str, Any]]]
+
+class TrafficState:
+	# ids created during the run, so deletes and document creation target live objects
+	def __init__(self, texts: List[str]):
+		self.texts = texts
+		self.libraries: Dict[str, List[str]] = {SAMPLE_LIBRARY_ID: []}
+		self.documents: Dict[str, str] = {}
+
+	def random_text(self, max_len: int = 1500) -> str:
+		text = random.choice(self.texts)
+		start = random.randrange(max(1, len(text) - max_len))
+		return text[start:start + random.randint(200, max_len)]
+
+	def random_library(self) -> Optional[str]:
+		return random.choice(list(self.libraries)) if self.libraries else None
+
+	def random_document(self) -> Optional[str]:
+		return random.choice(list(self.documents)) if self.documents else None
+
+	def add_document(self, library_id: str, document_id: str) -> None:
+		if library_id in self.libraries:
+			self.libraries[library_id].append(document_id)
+			self.documents[document_id] = library_id
+
+	def pop_document(self) -> Optional[str]:
+		document_id = self.random_document()
+		if document_id is None:
+			return None
+		library_id = self.documents.pop(document_id)
+		if document_id in self.libraries.get(library_id, []):
+			self.libraries[library_id].remove(document_id)
+		return document_id
+
+	def pop_library(self) -> Optional[str]:
+		# the sample library is kept so searches always have something to hit
+		candidates = [lib_id for lib_id in self.libraries if lib_id != SAMPLE_LIBRARY_ID]
+		if not candidates:
+			return None
+		library_id = random.choice(candidates)
+		for document_id in self.libraries.pop(library_id):
+			self.documents.pop(document_id, None)
+		return library_id
+
+# Build the next request of a given operation. Ids are claimed from the state before the
+# request is sent so concurrent workers do not delete the same object twice.
+def build_request(op: str, state: TrafficState) -> Optional[Request]:
+	if op == "create_library":
+		body = {"name": f"load-test-{uuid.uuid4()}", "description": "Created by load_test.py", "metadata": {}}
+		return "POST /libraries/", "POST", "/libraries/", body
+	elif op == "create_document":
+		library_id = state.random_library()
+		if library_id is None:
+			return None
+		body = {"library_id": library_id, "title": "Load test document", "content": state.random_text(), "metadata": {}}
+		return "POST /documents/", "POST", "/documents/", body
+	elif op == "search":
+		body = {"query": random.choice(SEARCH_QUERIES), "k": random.choice([1, 5, 10])}
+		return "POST /documents/search", "POST", "/documents/search", body
+	elif op == "delete_document":
+		document_id = state.pop_document()
+		if document_id is None:
+			return None
+		return "DELETE /documents/{document_id}", "DELETE", f"/documents/{document_id}", None
+	elif op == "delete_library":
+		library_id = state.pop_library()
+		if library_id is None:
+			return None
+		return "DELETE /libraries/{library_id}", "DELETE", f"/libraries/{library_id}", None
+	else:
+		raise ValueError(f"Unknown operation: {op}")
+
+# Fill the placeholders of a recorded request and label it with its templated path. As with
+# build_request, the ids of a DELETE are claimed so no two deletes target the same object;
+# a delete with nothing left to delete returns None.
+def build_replay_request(record: Dict[str, Any], state: TrafficState) -> Optional[Request]:
+	method = record["method"].upper()
+	path = record["path"]
+	ids = {}
+	if method == "DELETE" and "{document_id}" in path:
+		ids["document_id"] = state.pop_document()
+	elif method == "DELETE" and "{library_id}" in path:
+		ids["library_id"] = state.pop_library()
+	if None in ids.values():
+		return None
+	ids.setdefault("library_id", state.random_library() or SAMPLE_LIBRARY_ID)
+	ids.setdefault("document_id", state.random_document() or str(uuid.uuid4()))
+
+	def fill(value):
+		if isinstance(value, str):
+			for key, id_ in ids.items():
+				value = value.replace("{" + key + "}", id_)
+			return value
+		if isinstance(value, dict):
+			return {k: fill(v) for k, v in value.items()}
+		if isinstance(value, list):
+			return [fill(v) for v in value]
+		return value
+
+	return f"{method} {path}", method, fill(path), fill(record.get("json"))
+
+def track_response(request: Request, response: httpx.Response, state: TrafficState) -> None:
+	label, _, _, body = request
+	if response.status_code >= 400:
+		return
+	if label == "POST /libraries/":
+		state.libraries.setdefault(response.json()["id"], [])
+	elif label == "POST /documents/":
+		state.add_document(body["library_id"], response.json()["id"])
+
+class Stats:
+	# errors are kept apart by kind: 4xx are mostly the harness racing its own deletes,
+	# 5xx are server failures and "failed" are requests that got no response at all
+	ERROR_KINDS = ["4xx", "5xx", "failed"]
+
+	def __init__(self):
+		self.latencies: Dict[str, List[float]] = defaultdict(list)
+		self.errors: Dict[str, Dict[str, int]] = {kind: defaultdict(int) for kind in self.ERROR_KINDS}
+		# open loop only: target rate, and time each request waited past its scheduled send time
+		self.offered_rps: Optional[float] = None
+		self.queue_delays: List[float] = []
+
+	def record(self, label: str, latency: float, status_code: Optional[int]) -> None:
+		self.latencies[label].append(latency)
+		if status_code is None:
+			self.errors["failed"][label] += 1
+		elif status_code >= 500:
+			self.errors["5xx"][label] += 1
+		elif status_code >= 400:
+			self.errors["4xx"][label] += 1
+
+	def report(self, elapsed: float) -> Dict[str, Dict[str, float]]:
+		report = {}
+		labels = sorted(self.latencies)
+		for label in labels + ["TOTAL"]:
+			if label == "TOTAL":
+				latencies = [lat for label_ in labels for lat in self.latencies[label_]]
+				errors = {kind: sum(counts.values()) for kind, counts in self.errors.items()}
+			else:
+				latencies = self.latencies[label]
+				errors = {kind: counts[label] for kind, counts in self.errors.items()}
+			if not latencies:
+				continue
+			p50, p95, p99 = np.percentile(np.array(latencies) * 1000, [50, 95, 99])
+			report[label] = {
+				"requests": len(latencies),
+				"throughput_rps": len(latencies) / elapsed,
+				"p50_ms": p50,
+				"p95_ms": p95,
+				"p99_ms": p99,
+				**{f"{kind}_rate": errors[kind] / len(latencies) for kind in self.ERROR_KINDS},
+			}
+		if self.offered_rps is not None:
+			delays = np.array(self.queue_delays)
+			report["schedule"] = {
+				"offered_rps": self.offered_rps,
+				"achieved_rps": len(delays) / elapsed,
+				"late_requests": int(np.sum(delays > LATE_THRESHOLD)),
+				"max_queue_ms": float(delays.max() * 1000) if len(delays) else 0.0,
+			}
+		return report
+
+# In open loop runs latency is measured from the scheduled send time, so time spent waiting
+# for a free slot in the client counts, as it would for a real user.
+async def send(client: httpx.AsyncClient, request: Request, state: TrafficState, stats: Stats, scheduled: Optional[float] = None) -> None:
+	label, method, path, body = request
+	start = time.perf_counter()
+	if scheduled is not None:
+		stats.queue_delays.append(max(0.0, start - scheduled))
+		start = scheduled
+	try:
+		response = await client.request(method, path, json=body)
+	except httpx.HTTPError:
+		response = None
+	stats.record(label, time.perf_counter() - start, response.status_code if response is not None else None)
+	if response is not None:
+		track_response(request, response, state)
+
+class RequestSource:
+	# yields the requests of the run, from the weighted mix or from a replay file
+	def __init__(self, state: TrafficState, mix: Dict[str, float], replay: Optional[List[Dict[str, Any]]], max_requests: Optional[int]):
+		self.state = state
+		self.ops, self.weights = zip(*mix.items())
+		self.replay = replay
+		self.max_requests = len(replay) if replay is not None and max_requests is None else max_requests
+		self.issued = 0
+
+	def next(self) -> Optional[Request]:
+		if self.max_requests is not None and self.issued >= self.max_requests:
+			return None
+		self.issued += 1
+		if self.replay is not None:
+			# recorded deletes with nothing left to delete are skipped
+			request = build_replay_request(self.replay[(self.issued - 1) % len(self.replay)], self.state)
+			while request is None and (self.max_requests is None or self.issued < self.max_requests):
+				self.issued += 1
+				request = build_replay_request(self.replay[(self.issued - 1) % len(self.replay)], self.state)
+			return request
+		# an operation with nothing to act on (e.g. no document left to delete) falls back to a search
+		request = build_request(random.choices(self.ops, self.weights)[0], self.state)
+		return request or build_request("search", self.state)
+
+async def run_closed_loop(client: httpx.AsyncClient, source: RequestSource, concurrency: int, deadline: float, stats: Stats) -> None:
+	async def worker():
+		while time.perf_counter() < deadline:
+			request = source.next()
+			if request is None:
+				return
+			await send(client, request, source.state, stats)
+
+	await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+async def run_open_loop(client: httpx.AsyncClient, source: RequestSource, rate: float, concurrency: int, deadline: float, stats: Stats) -> None:
+	# requests are issued on a fixed schedule regardless of how fast responses come back,
+	# up to `concurrency` in flight
+	in_flight = asyncio.Semaphore(concurrency)
+	tasks = []
+	start = time.perf_counter()
+	stats.offered_rps = rate
+
+	async def bounded(request, scheduled):
+		async with in_flight:
+			await send(client, request, source.state, stats, scheduled)
+
+	i = 0
+	while time.perf_counter() < deadline:
+		scheduled = start + i / rate
+		delay = scheduled - time.perf_counter()
+		if delay > 0:
+			await asyncio.sleep(delay)
+		request = source.next()
+		if request is None:
+			break
+		tasks.append(asyncio.create_task(bounded(request, scheduled)))
+		i += 1
+	await asyncio.gather(*tasks)
+
+# Register the documents of the sample library so deletes have real targets from the start
+async def seed_state(client: httpx.AsyncClient, state: TrafficState) -> None:
+	response = await client.get(f"/libraries/{SAMPLE_LIBRARY_ID}")
+	if response.status_code == 200:
+		for document in response.json():
+			state.add_document(SAMPLE_LIBRARY_ID, document["id"])
+
+async def wait_until_ready(client: httpx.AsyncClient, timeout: float) -> None:
+	# the sample library loads in the background, traffic starts once the index is warm
+	deadline = time.perf_counter() + timeout
+	while time.perf_counter() < deadline:
+		try:
+			if (await client.get("/health/ready")).status_code == 200:
+				return
+		except httpx.HTTPError:
+			pass
+		await asyncio.sleep(0.01)
+	raise TimeoutError(f"Service not ready after {timeout}s")
+
+# Start a uvicorn server and time how long it takes to answer liveness and readiness probes
+def measure_startup(port: int, timeout: float) -> Dict[str, float]:
+	env = dict(os.environ)
+	env.setdefault("EMBEDDER", "local")
+	start = time.perf_counter()
+	server = subprocess.Popen([sys.executable, "-m", "uvicorn", "main:app", "--port", str(port)],
+		env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+	timings = {}
+	try:
+		with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=1.0) as client:
+			for probe in ["live", "ready"]:
+				while f"{probe}_ms" not in timings:
+					if time.perf_counter() - start > timeout or server.poll() is not None:
+						raise RuntimeError(f"Server did not become {probe} within {timeout}s")
+					try:
+						if client.get(f"/health/{probe}").status_code == 200:
+							timings[f"{probe}_ms"] = (time.perf_counter() - start) * 1000
+							continue
+					except httpx.HTTPError:
+						pass
+					# back off so polling does not compete for CPU with the server being timed
+					time.sleep(0.005)
+	finally:
+		server.terminate()
+		server.wait()
+	return timings
+
+def load_texts(data_dir: str) -> List[str]:
+	texts = []
+	for name in sorted(os.listdir(data_dir)):
+		if not name.endswith(".txt"):
+			continue
+		with open(os.path.join(data_dir, name), 'r') as f:
+			texts.append(f.read())
+	return texts
+
+def parse_mix(mix: str) -> Dict[str, float]:
+	weights = {}
+	for item in mix.split(","):
+		op, weight = item.split("=")
+		weights[op.strip()] = float(weight)
+	return weights
+
+async def main(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+	state = TrafficState(load_texts(args.data_dir))
+	replay = None
+	if args.replay:
+		with open(args.replay, 'r') as f:
+			replay = [json.loads(line) for line in f if line.strip()]
+	source = RequestSource(state, parse_mix(args.mix), replay, args.requests)
+	stats = Stats()
+
+	async def run(client):
+		await wait_until_ready(client, args.timeout)
+		await seed_state(client, state)
+		start = time.perf_counter()
+		deadline = start + args.duration
+		if args.rate:
+			await run_open_loop(client, source, args.rate, args.concurrency, deadline, stats)
+		else:
+			await run_closed_loop(client, source, args.concurrency, deadline, stats)
+		return time.perf_counter() - start
+
+	timeout = httpx.Timeout(args.timeout)
+	if args.url:
+		async with httpx.AsyncClient(base_url=args.url, timeout=timeout) as client:
+			elapsed = await run(client)
+	else:
+		# the app reads the embedder configuration at import time
+		os.environ.setdefault("EMBEDDER", "local")
+		if args.embedder_latency_ms:
+			os.environ["EMBEDDER_LATENCY_MS"] = str(args.embedder_latency_ms)
+		from main import app
+		# run the startup hook so the sample library exists, as with uvicorn
+		async with app.router.lifespan_context(app):
+			# unhandled errors become 500 responses, as they would behind uvicorn
+			transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+			async with httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=timeout) as client:
+				elapsed = await run(client)
+
+	return stats.report(elapsed)
+
+def print_report(report: Dict[str, Dict[str, float]]) -> None:
+	header = (f"{'endpoint':<34}{'requests':>10}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+		+ "".join(f"{kind:>9}" for kind in Stats.ERROR_KINDS))
+	print(header)
+	print("-" * len(header))
+	for label, row in report.items():
+		if label == "schedule":
+			continue
+		print(f"{label:<34}{row['requests']:>10}{row['throughput_rps']:>10.1f}{row['p50_ms']:>10.1f}"
+			f"{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}" + "".join(f"{row[kind + '_rate']:>9.1%}" for kind in Stats.ERROR_KINDS))
+	if "schedule" in report:
+		schedule = report["schedule"]
+		print(f"offered {schedule['offered_rps']:.1f} rps, achieved {schedule['achieved_rps']:.1f} rps, "
+			f"{schedule['late_requests']} requests sent late (max queue {schedule['max_queue_ms']:.0f} ms)")
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Load test the RAG backend with a mix of ingest and search traffic.")
+	parser.add_argument("--url", help="base url of a running server, the app is driven in-process if omitted")
+	parser.add_argument("--concurrency", type=int, default=8, help="number of concurrent clients (max in flight with --rate)")
+	parser.add_argument("--rate", type=float, help="target requests per second (open loop); closed loop if omitted")
+	parser.add_argument("--duration", type=float, default=10.0, help="run time in seconds")
+	parser.add_argument("--requests", type=int, help="stop after this many requests")
+	parser.add_argument("--mix", default=DEFAULT_MIX, help="weighted operation mix, e.g. search=10,create_document=2")
+	parser.add_argument("--replay", help="JSON lines file of recorded requests to replay instead of the mix")
+	parser.add_argument("--embedder-latency-ms", type=float, default=0.0, help="simulated embedding API latency (in-process only)")
+	parser.add_argument("--timeout", type=float, default=30.0, help="per request timeout in seconds")
+	parser.add_argument("--data-dir", default="data", help="directory with the texts used as document content")
+	parser.add_argument("--json", dest="json_path", help="also write the report as json to this path")
+	parser.add_argument("--seed", type=int, help="random seed for a reproducible request sequence")
+	parser.add_argument("--measure-startup", action="store_true", help="only time a cold start of uvicorn until live and ready")
+	parser.add_argument("--port", type=int, default=8765, help="port used by --measure-startup")
+	args = parser.parse_args()
+
+	if args.measure_startup:
+		timings = measure_startup(args.port, args.timeout)
+		print(f"live after {timings['live_ms']:.0f} ms, ready after {timings['ready_ms']:.0f} ms")
+		sys.exit(0)
+
+	if args.seed is not None:
+		random.seed(args.seed)
+	report = asyncio.run(main(args))
+	print_report(report)
+	if args.json_path:
+		with open(args.json_path, 'w') as f:
+			json.dump(report, f, indent=2)
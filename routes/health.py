@@ -0,0 +1,16 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from db import db
+
+router = APIRouter(prefix="/health")
+
+@router.get("/live")
+def liveness_endpoint():
+	return {"status": "alive"}
+
+@router.get("/ready")
+def readiness_endpoint():
+	if not db.ready.is_set():
+		status = "failed" if db.startup_error else "starting"
+		return JSONResponse(status_code=503, content={"status": status, "error": db.startup_error})
+	return {"status": "ready", "startup_seconds": db.startup_seconds, "chunks": len(db.chunks)}
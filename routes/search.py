@@ -1,4 +1,4 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from db import db
 from schemas import SearchQueryRequest, SearchResultResponse
 from services.documents_service import search_documents
@@ -7,6 +7,9 @@ router = APIRouter(prefix="/documents")
 
 @router.post("/search")
 def search_documents_endpoint(request: SearchQueryRequest):
+	# the sample library loads in the background, searching before that would return partial results
+	if not db.ready.is_set():
+		raise HTTPException(status_code=503, detail="Index is warming up, retry once /health/ready reports ready.")
 	results = search_documents(db, request)
 	response = []
 	for chunk, score in results:
@@ -31,11 +31,11 @@ def create_document(db: DB, request: CreateDocumentRequest) -> Document:
 		# create chunker object
 		#chunker = get_chunker("fixed", chunk_size = 200)
 		
-		# split the text of document into chunks
-		chunks_list = chunker.chunk(content)
+		# chunk spans are produced lazily so each chunk is embedded as soon as it is cut
 		chunk_ids = []
 		
-		for chunk_text in chunks_list:
+		for offset, length in chunker.iter_chunks(content):
+		    chunk_text = content[offset:offset + length]
 		    # generate vector embeddings and create chunk object
 		    embedding = vector_embedder(chunk_text, input_type='search_document')
 		    chunk = Chunk(